@@ -1,7 +1,9 @@
 from flask import Flask, request, render_template, jsonify, send_from_directory, Response
 import os
+import re
 import shutil
-import markdown
+import email
+from email import policy
 import zipfile  # Add this import for handling zip files
 
 # Variables
@@ -16,13 +18,9 @@ def extract_images_and_convert_to_md(file_path, convert_to_png=True):
     Extract images and convert MHT file to Markdown.
     This implementation processes the MHT file, extracts images, converts them to PNG, 
     and saves the Markdown file in the output directory.
+    BeautifulSoup and PIL are imported on first use to keep app startup fast.
     """
-    import email
-    from email import policy
     from bs4 import BeautifulSoup
-    from PIL import Image
-    import re
-    import io
 
     # Create a directory under 'uploads' for the output
     base_name = os.path.splitext(os.path.basename(file_path))[0]
@@ -77,6 +75,8 @@ def extract_images_and_convert_to_md(file_path, convert_to_png=True):
 
     # Convert all JPEG images to PNG if convert_to_png is True
     if convert_to_png:
+        from PIL import Image
+
         for image_filename in os.listdir(output_dir):
             if image_filename.lower().endswith('.jpeg'):
                 jpeg_path = os.path.join(output_dir, image_filename)
@@ -132,6 +132,7 @@ def view_html(output_dir):
         if md_file_path:
             with open(md_file_path, 'r', encoding='utf-8') as md_file:
                 markdown_content = md_file.read()
+            import markdown  # Only needed when rendering
             html_content = markdown.markdown(markdown_content)
             # Embed CSS for responsive images
             html_with_styles = f"""
@@ -0,0 +1,105 @@
+"""Import-time regression benchmark for the mht2md package.
+
+Runs each case in a fresh interpreter so every measurement is a cold start.
+Fails if importing the package pulls in a heavy dependency, if converting
+a small file without --png loads PIL or markdown, or if a case exceeds its
+time budget. BeautifulSoup is still needed for every conversion and
+dominates the per-file time.
+
+Usage:
+    python benchmarks/import_time.py [--runs N]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be imported on demand
+HEAVY_MODULES = ["bs4", "PIL", "markdown", "email.policy"]
+
+# Modules that must stay unloaded after converting a file without --png
+CONVERT_UNUSED_MODULES = ["PIL", "markdown"]
+
+# Median wall time budget in seconds, measured against a bare interpreter start.
+# Measured at about 10 ms and 105-140 ms; bs4 accounts for most of the conversion case.
+BUDGETS = {
+    "import mht2md": 0.025,
+    "python -m mht2md (small file)": 0.17,
+}
+
+SMALL_MHT = (
+    "MIME-Version: 1.0\r\n"
+    "Content-Type: multipart/related; boundary=\"=_NextPart\"\r\n"
+    "\r\n"
+    "--=_NextPart\r\n"
+    "Content-Type: text/html; charset=\"utf-8\"\r\n"
+    "\r\n"
+    "<html><body><p>Step 1: User left click on \"Start\"</p></body></html>\r\n"
+    "--=_NextPart--\r\n"
+)
+
+def time_command(args, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=REPO_ROOT, check=True, stdout=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+def loaded_modules(setup, modules):
+    # Run setup in a fresh interpreter and report which of the modules it left in sys.modules
+    code = (
+        "import sys\n"
+        f"{setup}\n"
+        f"loaded = [m for m in {modules!r} if m in sys.modules]\n"
+        "print('loaded:' + ','.join(loaded))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True, capture_output=True, text=True)
+    line = next(line for line in result.stdout.splitlines() if line.startswith("loaded:"))
+    return [m for m in line[len("loaded:"):].split(",") if m]
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold start time of the mht2md package.")
+    parser.add_argument("--runs", type=int, default=10, help="Number of runs per case (default: 10)")
+    args = parser.parse_args()
+
+    failures = []
+
+    loaded = loaded_modules("import mht2md", HEAVY_MODULES)
+    if loaded:
+        failures.append(f"'import mht2md' loaded heavy modules: {', '.join(loaded)}")
+
+    baseline = time_command([sys.executable, "-c", "pass"], args.runs)
+    print(f"{'interpreter start':<32} {baseline * 1000:8.1f} ms")
+
+    with tempfile.TemporaryDirectory() as folder:
+        small_mht = os.path.join(folder, "small.mht")
+        with open(small_mht, "w", newline="") as f:
+            f.write(SMALL_MHT)
+
+        setup = f"from mht2md.__main__ import main\nmain(['--no-resize', {small_mht!r}])"
+        loaded = loaded_modules(setup, CONVERT_UNUSED_MODULES)
+        if loaded:
+            failures.append(f"converting a small file without --png loaded: {', '.join(loaded)}")
+
+        cases = {
+            "import mht2md": [sys.executable, "-c", "import mht2md"],
+            "python -m mht2md (small file)": [sys.executable, "-m", "mht2md", "--no-resize", small_mht],
+        }
+        for name, command in cases.items():
+            overhead = time_command(command, args.runs) - baseline
+            print(f"{name:<32} {overhead * 1000:8.1f} ms (budget {BUDGETS[name] * 1000:.0f} ms)")
+            if overhead > BUDGETS[name]:
+                failures.append(f"{name} took {overhead * 1000:.1f} ms, over the {BUDGETS[name] * 1000:.0f} ms budget")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+# mht2md: convert MHT (MIME HTML) step recordings to Markdown.
+# Importing the package is kept cheap; BeautifulSoup and PIL are only loaded when a file is converted.
+from .converter import extract_images_and_convert_to_md
+
+__author__ = "Kevin C. Jones"
+__email__ = "jonesckevin@proton.me"
+__site__ = "https://github.com/jonesckevin/mht2md.git"
+
+__all__ = ["extract_images_and_convert_to_md"]
@@ -0,0 +1,56 @@
+import os  # For file and directory operations
+import sys  # For locating the running interpreter
+import argparse  # For command line options
+import subprocess  # For running external scripts
+
+from . import __author__, __email__, __site__
+from .converter import extract_images_and_convert_to_md
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m mht2md", description="Convert MHT files, or all MHT files in a folder, to Markdown.")
+    parser.add_argument("paths", nargs="*", default=[os.getcwd()], help="MHT files or folders containing MHT files (default: current folder)")
+    parser.add_argument("--png", action="store_true", help="Convert images to PNG format (default: keep the original JPEG images)")
+    parser.add_argument("--no-resize", action="store_true", help="Do not ask to run resize-images.py afterwards")
+    args = parser.parse_args(argv)
+
+    print(f"Package: {__package__}")
+    print(f"Author: {__author__}")
+    print(f"Email: {__email__}")
+    print(f"Site: {__site__}")
+
+    print(f"Converting to PNG is slower but produces higher quality images.")
+    print(f"Convert images to PNG: {args.png}")
+
+    # Collect the MHT files given directly and all MHT files in the given folders
+    mht_files = []
+    for path in args.paths:
+        path = os.path.abspath(path)
+        if os.path.isdir(path):
+            mht_files.extend(os.path.join(path, f) for f in os.listdir(path) if f.endswith('.mht'))
+        elif path.endswith('.mht') and os.path.isfile(path):
+            mht_files.append(path)
+        else:
+            parser.error(f"{path} is not an MHT file or a folder")
+
+    if not mht_files:
+        print("No MHT files found in the working folder.")
+        return
+
+    # Process each MHT file
+    for mht_file in mht_files:
+        extract_images_and_convert_to_md(mht_file, args.png)
+
+    if args.no_resize:
+        return
+
+    # Prompt the user if they want to run the resize-images.py script
+    run_resize = input("Do you want to run the resize-images.py script to crop all the photos? (yes/no): ").strip().lower()
+    if run_resize.lower() in ['yes', 'y', 'ye', 'yeah', 'yep', 'yup', 'sure', 'ok', 'okay']:
+        resize_script_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resize-images.py')
+        if os.path.exists(resize_script_path):
+            subprocess.run([sys.executable, resize_script_path])
+        else:
+            print("resize-images.py script not found next to the mht2md package")
+
+if __name__ == "__main__":
+    main()
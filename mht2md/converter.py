@@ -1,30 +1,18 @@
 # Import necessary modules
 import os  # For file and directory operations
-import email  # For parsing html/text from MHT files
 import re  # For extracting and cleaning step text using regular expressions
-from email import policy  # For handling email parsing policies
-from bs4 import BeautifulSoup  # For parsing and manipulating HTML content
-from PIL import Image  # For image conversion
-import subprocess  # For running external scripts
 
-__author__ = "Kevin C. Jones"
-__email__ = "jonesckevin@proton.me"
-__site__ = "https://github.com/jonesckevin/mht2md.git"
+# Step text patterns, compiled once and shared by every conversion
+STEP_PATTERN = re.compile(r'^Step (\d+):')
+TIMESTAMP_PATTERN = re.compile(r'\(?\d{2}/\d{2}/\d{4} \d{1,2}:\d{2}:\d{2} [APM]{2}\)?')
+CLEAN_PATTERN = re.compile(r'^Step \d+:|\(?\d{2}/\d{2}/\d{4} \d{1,2}:\d{2}:\d{2} [APM]{2}\)?|[^\x00-\x7F]+')
 
-print(f"File Name: {os.path.basename(__file__)}")
-print(f"Author: {__author__}")
-print(f"Email: {__email__}")
-print(f"Site: {__site__}")
+def extract_images_and_convert_to_md(mht_file, convert_to_png=False):
+    # Heavy dependencies are imported on first use so importing the package stays fast
+    import email  # For parsing html/text from MHT files
+    from email import policy  # For handling email parsing policies
+    from bs4 import BeautifulSoup  # For parsing and manipulating HTML content
 
-## Set the flag to convert images to PNG format. 
-# True: Convert images to PNG format
-# False: Keep images in their original format (JPEG)
-convert_to_png = False
-
-print(f"Converting to PNG is slower but produces higher quality images.")
-print(f"Convert images to PNG: {convert_to_png}")
-
-def extract_images_and_convert_to_md(mht_file, convert_to_png):
     # Get the base name of the MHT file and create an output directory
     base_name = os.path.splitext(os.path.basename(mht_file))[0]
     output_dir = os.path.join(os.path.dirname(mht_file), base_name)
@@ -61,10 +49,10 @@ def extract_images_and_convert_to_md(mht_file, convert_to_png):
     steps_text = {}
     # Extract and clean step text from the HTML content
     for text in soup.stripped_strings:
-        match = re.match(r'^Step (\d+):', text)
-        if match and not re.search(r'\(?\d{2}/\d{2}/\d{4} \d{1,2}:\d{2}:\d{2} [APM]{2}\)?', text):
+        match = STEP_PATTERN.match(text)
+        if match and not TIMESTAMP_PATTERN.search(text):
             step_number = int(match.group(1))
-            clean_text = re.sub(r'^Step \d+:|\(?\d{2}/\d{2}/\d{4} \d{1,2}:\d{2}:\d{2} [APM]{2}\)?|[^\x00-\x7F]+', '', text)
+            clean_text = CLEAN_PATTERN.sub('', text)
             steps_text[step_number] = steps_text.get(step_number, '') + ' ' + clean_text.strip()
 
     # Generate markdown content from the extracted steps
@@ -78,6 +66,8 @@ def extract_images_and_convert_to_md(mht_file, convert_to_png):
 
     # Convert all jpeg images to png if convert_to_png is True
     if convert_to_png:
+        from PIL import Image  # For image conversion, only needed when transcoding
+
         for image_filename in os.listdir(output_dir):
             if image_filename.endswith('.JPEG'):
                 jpeg_path = os.path.join(output_dir, image_filename)
@@ -87,24 +77,3 @@ def extract_images_and_convert_to_md(mht_file, convert_to_png):
                 os.remove(jpeg_path)
 
     print(f"Markdown file and images have been saved to {output_dir}")
-
-if __name__ == "__main__":
-    # Get the working folder and find all MHT files in it
-    working_folder = os.path.dirname(os.path.abspath(__file__))
-    mht_files = [os.path.join(working_folder, f) for f in os.listdir(working_folder) if f.endswith('.mht')]
-
-    if not mht_files:
-        print("No MHT files found in the working folder.")
-    else:
-        # Process each MHT file
-        for mht_file in mht_files:
-            extract_images_and_convert_to_md(mht_file, convert_to_png)
-
-        # Prompt the user if they want to run the resize-images.py script
-        run_resize = input("Do you want to run the resize-images.py script to crop all the photos? (yes/no): ").strip().lower()
-        if run_resize.lower() in ['yes', 'y', 'ye', 'yeah', 'yep', 'yup', 'sure', 'ok', 'okay']:
-            resize_script_path = os.path.join(working_folder, 'resize-images.py')
-            if os.path.exists(resize_script_path):
-                subprocess.run(['python', resize_script_path])
-            else:
-                print(f"resize-images.py script not found in {working_folder}")
@@ -1,7 +1,8 @@
 import os
-from tkinter import Tk, filedialog, Scrollbar, Canvas, Frame, messagebox
-from PIL import Image, ImageTk
-import tkinter as tk
+import sys
+import argparse
+import numpy as np
+from PIL import Image
 
 __author__ = "Kevin C. Jones"
 __email__ = "jonesckevin@proton.me"
@@ -13,6 +14,21 @@ print(f"Email: {__email__}")
 print(f"Site: {__site__}")
 
 MAX_HEIGHT = 1080
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".JPEG", ".PNG", ".JPG", ".TIFF", ".tiff")
+
+## Auto-crop settings
+# THUMBNAIL_WIDTH: Width the screenshots are downscaled to before analysis
+# STATIC_VARIANCE: Per-pixel variance below which a pixel is considered unchanged across the set
+# STATIC_FRACTION: Fraction of static pixels for an edge row/column to count as border or taskbar
+# UNIFORM_FRACTION: Fraction of an edge row/column that must match its median colour to count as border or taskbar
+# CONTENT_TOLERANCE: Grey-level difference from the background that marks a pixel as content
+# CHUNK_SIZE: Number of thumbnails processed at once, bounding the size of temporary arrays
+THUMBNAIL_WIDTH = 320
+STATIC_VARIANCE = 4.0
+STATIC_FRACTION = 0.98
+UNIFORM_FRACTION = 0.95
+CONTENT_TOLERANCE = 12
+CHUNK_SIZE = 64
 
 def resize_image(image):
     if image.height > MAX_HEIGHT:
@@ -21,8 +37,12 @@ def resize_image(image):
         image = image.resize((new_width, MAX_HEIGHT), Image.LANCZOS)
     return image
 
-print("Select the crop area on the image and click Confirm to crop all images in the selected folder.")
 def select_crop_area(image_path):
+    # tkinter is only imported for the GUI so --auto also runs where it is not installed
+    import tkinter as tk
+    from tkinter import Tk, Scrollbar, Canvas, Frame, messagebox
+    from PIL import ImageTk
+
     try:
         root = Tk()
         root.title("Select Crop Area")
@@ -82,29 +102,161 @@ def select_crop_area(image_path):
         messagebox.showerror("Error", f"An error occurred: {e}")
         return None
 
+def crop_images(image_paths, crop_coords, original_size, resized_size):
+    # Scale crop coordinates back to original image size
+    scale_x = original_size[0] / resized_size[0]
+    scale_y = original_size[1] / resized_size[1]
+    scaled_crop_coords = (
+        int(crop_coords[0][0] * scale_x),
+        int(crop_coords[0][1] * scale_y),
+        int(crop_coords[1][0] * scale_x),
+        int(crop_coords[1][1] * scale_y)
+    )
+    for image_path in image_paths:
+        img = Image.open(image_path)
+        print(f"Cropping image {os.path.basename(image_path)} to {scaled_crop_coords}")
+        cropped_img = img.crop(scaled_crop_coords)
+        cropped_img.save(image_path)
+
 def crop_images_in_folder(folder_path, crop_coords, original_size, resized_size):
+    from tkinter import messagebox
+
     try:
-        for filename in os.listdir(folder_path):
-            if filename.endswith((".png", ".jpg", ".jpeg", ".JPEG", ".PNG", ".JPG", ".TIFF", ".tiff")):
-                image_path = os.path.join(folder_path, filename)
-                img = Image.open(image_path)
-                
-                # Scale crop coordinates back to original image size
-                scale_x = original_size[0] / resized_size[0]
-                scale_y = original_size[1] / resized_size[1]
-                scaled_crop_coords = (
-                    int(crop_coords[0][0] * scale_x),
-                    int(crop_coords[0][1] * scale_y),
-                    int(crop_coords[1][0] * scale_x),
-                    int(crop_coords[1][1] * scale_y)
-                )
-                print(f"Cropping image {filename} to {scaled_crop_coords}")
-                cropped_img = img.crop(scaled_crop_coords)
-                cropped_img.save(image_path)
+        image_paths = [os.path.join(folder_path, f) for f in os.listdir(folder_path) if f.endswith(IMAGE_EXTENSIONS)]
+        crop_images(image_paths, crop_coords, original_size, resized_size)
     except Exception as e:
         messagebox.showerror("Error", f"An error occurred while cropping images: {e}")
 
+def load_thumbnails(folder_path, width=THUMBNAIL_WIDTH):
+    # Downscale every screenshot to the same grayscale size and stack them into one (N, H, W) array
+    # Files that cannot be read as images, or differ in size from the first image, are skipped with a warning
+    thumbnails = []
+    image_paths = []
+    original_size = thumb_size = None
+    for filename in sorted(os.listdir(folder_path)):
+        if not filename.endswith(IMAGE_EXTENSIONS):
+            continue
+        image_path = os.path.join(folder_path, filename)
+        try:
+            with Image.open(image_path) as img:
+                if thumb_size is None:
+                    original_size = img.size
+                    thumb_size = (width, max(1, round(original_size[1] * width / original_size[0])))
+                elif img.size != original_size:
+                    print(f"Warning: skipping {filename}: size {img.size} differs from {original_size}", file=sys.stderr)
+                    continue
+                # Let the JPEG decoder skip straight to a reduced scale instead of decoding full size
+                img.draft("L", thumb_size)
+                thumbnails.append(np.asarray(img.convert("L").resize(thumb_size, Image.BILINEAR)))
+        except OSError as e:
+            print(f"Warning: skipping {filename}: {e}", file=sys.stderr)
+            continue
+        image_paths.append(image_path)
+
+    if not thumbnails:
+        return None, None, None, None
+    return np.stack(thumbnails), image_paths, original_size, thumb_size
+
+def _pixel_statistics(stack):
+    # Per-pixel mean and variance across the set, accumulated chunk by chunk to bound memory use
+    total = np.zeros(stack.shape[1:], dtype=np.float64)
+    total_sq = np.zeros(stack.shape[1:], dtype=np.float64)
+    for start in range(0, stack.shape[0], CHUNK_SIZE):
+        chunk = stack[start:start + CHUNK_SIZE].astype(np.float32)
+        total += chunk.sum(axis=0, dtype=np.float64)
+        total_sq += np.square(chunk).sum(axis=0, dtype=np.float64)
+    mean = total / stack.shape[0]
+    return mean, np.maximum(total_sq / stack.shape[0] - np.square(mean), 0)
+
+def _edge_span(flags):
+    # Return the first and last index of a boolean edge profile that is False, trimming True runs at both ends
+    keep = np.flatnonzero(~flags)
+    if keep.size == 0:
+        return 0, flags.size
+    return int(keep[0]), int(keep[-1]) + 1
+
+def _border_profile(static, mean, axis):
+    # A border or taskbar line is static across the set and close to a single colour along its length
+    uniform = np.abs(mean - np.median(mean, axis=axis, keepdims=True)) <= CONTENT_TOLERANCE
+    return (static.mean(axis=axis) >= STATIC_FRACTION) & (uniform.mean(axis=axis) >= UNIFORM_FRACTION)
+
+def detect_static_region(stack):
+    # Find the area inside the borders/taskbars that stay identical across every screenshot
+    # Static but detailed content, such as an unchanged application window, is kept
+    if stack.shape[0] < 2:
+        return 0, 0, stack.shape[2], stack.shape[1]
+    mean, variance = _pixel_statistics(stack)
+    static = variance < STATIC_VARIANCE
+    top, bottom = _edge_span(_border_profile(static, mean, axis=1))
+    left, right = _edge_span(_border_profile(static, mean, axis=0))
+    return left, top, right, bottom
+
+def _edge_background(stack):
+    # Most common grey level along the edge of each image, counted for every image at once
+    # The mode is used rather than the median so a static window touching the edge does not become the background
+    count = stack.shape[0]
+    edges = np.concatenate((stack[:, 0, :], stack[:, -1, :], stack[:, :, 0], stack[:, :, -1]), axis=1)
+    offsets = np.arange(count)[:, None] * 256 + edges
+    histogram = np.bincount(offsets.ravel(), minlength=count * 256).reshape(count, 256)
+    return histogram.argmax(axis=1).astype(np.int16)
+
+def detect_content_boxes(stack, background):
+    # Compute the content bounding box of every image, as an (N, 4) array of left, top, right, bottom,
+    # and an (N,) mask of the images that have any content. Each chunk is processed in one vectorized pass
+    count, height, width = stack.shape
+    boxes = np.empty((count, 4), dtype=np.intp)
+    found = np.empty(count, dtype=bool)
+    for start in range(0, count, CHUNK_SIZE):
+        chunk = stack[start:start + CHUNK_SIZE]
+        chunk_background = background[start:start + CHUNK_SIZE, None, None]
+        content = np.abs(chunk.astype(np.int16) - chunk_background) > CONTENT_TOLERANCE
+
+        rows = content.any(axis=2)
+        cols = content.any(axis=1)
+        chunk_boxes = np.stack((
+            cols.argmax(axis=1),
+            rows.argmax(axis=1),
+            width - cols[:, ::-1].argmax(axis=1),
+            height - rows[:, ::-1].argmax(axis=1),
+        ), axis=1)
+
+        boxes[start:start + CHUNK_SIZE] = chunk_boxes
+        found[start:start + CHUNK_SIZE] = rows.any(axis=1)
+    return boxes, found
+
+def auto_crop_area(stack):
+    # Combine the static border region with the union of the per-image content boxes
+    left, top, right, bottom = detect_static_region(stack)
+    region = stack[:, top:bottom, left:right]
+    boxes, found = detect_content_boxes(region, _edge_background(region))
+    # Blank images are left out of the union; if every image is blank keep the whole region
+    if not found.any():
+        return [(left, top), (right, bottom)]
+    boxes = boxes[found]
+    x0, y0 = boxes[:, :2].min(axis=0)
+    x1, y1 = boxes[:, 2:].max(axis=0)
+    return [(left + int(x0), top + int(y0)), (left + int(x1), top + int(y1))]
+
+def auto_crop_folder(folder_path):
+    # Errors are raised to the caller instead of being shown in a dialog, so this can run without a display
+    stack, image_paths, original_size, thumb_size = load_thumbnails(folder_path)
+    if stack is None:
+        print("No images found in the selected folder.")
+        return
+    crop_coords = auto_crop_area(stack)
+    print(f"Detected crop area: {crop_coords}")
+    if crop_coords == [(0, 0), thumb_size]:
+        print("Nothing to crop.")
+        return
+    crop_images(image_paths, crop_coords, original_size, thumb_size)
+    print("Images cropped successfully.")
+
 def main():
+    import tkinter as tk
+    from tkinter import Tk, filedialog, Scrollbar, Canvas, Frame, messagebox
+    from PIL import ImageTk
+
+    print("Select the crop area on the image and click Confirm to crop all images in the selected folder.")
     try:
         folder_path = filedialog.askdirectory(title="Select Folder Containing Images")
         if not folder_path:
@@ -112,7 +264,7 @@ def main():
             return
         first_image_path = None
         for filename in os.listdir(folder_path):
-            if filename.endswith((".png", ".jpg", ".jpeg", ".JPEG", ".PNG", ".JPG", ".TIFF", ".tiff")):
+            if filename.endswith(IMAGE_EXTENSIONS):
                 first_image_path = os.path.join(folder_path, filename)
                 break
 
@@ -187,5 +339,18 @@ def main():
         messagebox.showerror("Error", f"An error occurred: {e}")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Crop all images in a folder to the same area.")
+    parser.add_argument("folder", nargs="?", help="Folder containing the images (required with --auto)")
+    parser.add_argument("--auto", action="store_true", help="Detect the crop area automatically without the GUI")
+    args = parser.parse_args()
+    if args.auto:
+        if not args.folder:
+            parser.error("--auto requires a folder")
+        try:
+            auto_crop_folder(args.folder)
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        main()
     print("End of script.")
\ No newline at end of file
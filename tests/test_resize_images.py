@@ -0,0 +1,123 @@
+import os
+import sys
+import subprocess
+import importlib.util
+
+import numpy as np
+import pytest
+from PIL import Image
+
+# resize-images.py is a script with a hyphen in its name, so load it from its path
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resize-images.py")
+_SPEC = importlib.util.spec_from_file_location("resize_images", SCRIPT_PATH)
+resize_images = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(resize_images)
+
+HEIGHT, WIDTH = 200, 320
+DESKTOP, TASKBAR = 230, 30
+
+
+def make_frames(count=5):
+    # Desktop background with a taskbar along the bottom edge
+    frames = np.full((count, HEIGHT, WIDTH), DESKTOP, dtype=np.uint8)
+    frames[:, 185:, :] = TASKBAR
+    return frames
+
+
+def test_static_window_is_kept():
+    frames = make_frames()
+    # An application window that is identical in every frame, with some detail inside it
+    frames[:, 20:180, 20:300] = 120
+    frames[:, 20:30, 20:300] = 60
+    frames[:, 60:140:8, 40:280] = 200
+    # A small control that changes between frames
+    for i in range(frames.shape[0]):
+        frames[i, 150:160, 40:100] = 20 + 40 * i
+
+    assert resize_images.auto_crop_area(frames) == [(20, 20), (300, 180)]
+
+
+def test_border_and_taskbar_are_removed():
+    frames = make_frames()
+    # Content that moves between frames on an otherwise static desktop
+    for i in range(frames.shape[0]):
+        frames[i, 40 + 10 * i:80 + 10 * i, 60 + 20 * i:120 + 20 * i] = 90
+
+    assert resize_images.auto_crop_area(frames) == [(60, 40), (200, 120)]
+
+
+def test_blank_frame_is_left_out_of_union():
+    frames = make_frames()
+    for i in range(frames.shape[0]):
+        frames[i, 40 + 10 * i:80 + 10 * i, 60 + 20 * i:120 + 20 * i] = 90
+    # A blank screenshot has no content box and must not widen the crop to the full frame
+    frames[2, :185, :] = DESKTOP
+
+    assert resize_images.auto_crop_area(frames) == [(60, 40), (200, 120)]
+
+
+def test_all_blank_frames_keep_full_region():
+    frames = np.full((5, HEIGHT, WIDTH), DESKTOP, dtype=np.uint8)
+
+    assert resize_images.auto_crop_area(frames) == [(0, 0), (WIDTH, HEIGHT)]
+
+
+def test_static_region_uses_chunked_statistics(monkeypatch):
+    frames = make_frames(count=7)
+    for i in range(frames.shape[0]):
+        frames[i, 50:100, 50 + 5 * i:150] = 90
+    expected = resize_images.detect_static_region(frames)
+
+    monkeypatch.setattr(resize_images, "CHUNK_SIZE", 2)
+    assert resize_images.detect_static_region(frames) == expected
+
+
+def test_unreadable_images_are_skipped(tmp_path, capsys):
+    Image.new("L", (640, 400), DESKTOP).save(tmp_path / "step1.png")
+    (tmp_path / "junk.png").write_bytes(b"not an image")
+
+    stack, image_paths, original_size, thumb_size = resize_images.load_thumbnails(str(tmp_path))
+
+    assert stack.shape == (1, thumb_size[1], thumb_size[0])
+    assert image_paths == [str(tmp_path / "step1.png")]
+    assert original_size == (640, 400)
+    assert "junk.png" in capsys.readouterr().err
+
+
+def test_images_with_a_different_size_are_skipped(tmp_path, capsys):
+    Image.new("L", (640, 400), DESKTOP).save(tmp_path / "step1.png")
+    Image.new("L", (1280, 400), DESKTOP).save(tmp_path / "step2.png")
+
+    stack, image_paths, original_size, thumb_size = resize_images.load_thumbnails(str(tmp_path))
+
+    assert image_paths == [str(tmp_path / "step1.png")]
+    assert original_size == (640, 400)
+    assert "step2.png" in capsys.readouterr().err
+
+
+def test_auto_mode_runs_without_tkinter(tmp_path):
+    for i in range(3):
+        frame = Image.new("L", (640, 400), DESKTOP)
+        frame.paste(90, (100 + 40 * i, 100, 300 + 40 * i, 200))
+        frame.save(tmp_path / f"step{i}.png")
+
+    # Block tkinter so importing it fails, as on a headless install without it
+    code = (
+        "import sys, runpy\n"
+        "sys.modules['tkinter'] = None\n"
+        f"sys.argv = [{SCRIPT_PATH!r}, '--auto', {str(tmp_path)!r}]\n"
+        f"runpy.run_path({SCRIPT_PATH!r}, run_name='__main__')\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert "Select the crop area" not in result.stdout
+    # The content spans 280x100; allow for rounding at thumbnail scale
+    with Image.open(tmp_path / "step0.png") as img:
+        assert 280 <= img.size[0] < 300
+        assert 100 <= img.size[1] < 120
+
+
+def test_auto_crop_folder_raises_on_missing_folder(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        resize_images.auto_crop_folder(str(tmp_path / "missing"))